@@ -159,6 +159,35 @@ class ExcelReader:
             )
         )
 
+    def load_sheets(
+        self,
+        idx_or_names: list[int | str],
+        *,
+        header_row: int | None = 0,
+        column_names: list[str] | None = None,
+        skip_rows: int = 0,
+        n_rows: int | None = None,
+    ) -> list[ExcelSheet]:
+        """Loads several sheets in a single call. Each sheet is loaded by name if a string is
+        passed or by index if an integer is passed.
+
+        The same parameters are used for every sheet. See `load_sheet_by_idx` and
+        `load_sheet_by_name` for parameter documentation.
+        """
+        for idx_or_name in idx_or_names:
+            if isinstance(idx_or_name, int) and idx_or_name < 0:
+                raise ValueError(f"Expected idx to be > 0, got {idx_or_name}")
+        return [
+            ExcelSheet(sheet)
+            for sheet in self._reader.load_sheets(
+                idx_or_names,
+                header_row=header_row,
+                column_names=column_names,
+                skip_rows=skip_rows,
+                n_rows=n_rows,
+            )
+        ]
+
     def __repr__(self) -> str:
         return self._reader.__repr__()
 
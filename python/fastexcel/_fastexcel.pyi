@@ -51,6 +51,15 @@ class _ExcelReader:
         skip_rows: int = 0,
         n_rows: int | None = None,
     ) -> _ExcelSheet: ...
+    def load_sheets(
+        self,
+        idx_or_names: list[int | str],
+        *,
+        header_row: int | None = 0,
+        column_names: list[str] | None = None,
+        skip_rows: int = 0,
+        n_rows: int | None = None,
+    ) -> list[_ExcelSheet]: ...
     @property
     def sheet_names(self) -> list[str]: ...
 
@@ -0,0 +1,42 @@
+from functools import lru_cache
+from os.path import dirname
+from os.path import join as path_join
+
+import pytest
+
+import fastexcel
+
+_FIXTURE_DIR = path_join(dirname(__file__), "fixtures")
+
+
+@lru_cache(maxsize=None)
+def path_for_fixture(fixture_file: str) -> str:
+    return path_join(_FIXTURE_DIR, fixture_file)
+
+
+# Fixture files are never modified by the tests, so each of them is opened once per session and
+# the resulting reader is shared by every test using it
+
+
+@pytest.fixture(scope="session")
+def single_sheet_reader() -> fastexcel.ExcelReader:
+    return fastexcel.read_excel(path_for_fixture("fixture-single-sheet.xlsx"))
+
+
+@pytest.fixture(scope="session")
+def single_sheet_with_types_reader() -> fastexcel.ExcelReader:
+    return fastexcel.read_excel(
+        path_for_fixture("fixture-single-sheet-with-types.xlsx")
+    )
+
+
+@pytest.fixture(scope="session")
+def multi_sheet_reader() -> fastexcel.ExcelReader:
+    return fastexcel.read_excel(path_for_fixture("fixture-multi-sheet.xlsx"))
+
+
+@pytest.fixture(scope="session")
+def changing_header_reader() -> fastexcel.ExcelReader:
+    return fastexcel.read_excel(
+        path_for_fixture("fixture-changing-header-location.xlsx")
+    )
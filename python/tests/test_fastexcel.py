@@ -1,331 +1,397 @@
-from os.path import dirname
-from os.path import join as path_join
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
 
+import numpy as np
 import pytest
-from pandas import DataFrame, Timestamp
-from pandas.testing import assert_frame_equal
+from numpy.testing import assert_array_equal
+from pandas import DataFrame
 
 import fastexcel
 
 
-def path_for_fixture(fixture_file: str) -> str:
-    return path_join(dirname(__file__), "fixtures", fixture_file)
+def timestamp_array(value: str, length: int) -> np.ndarray:
+    """Builds an array of `length` identical timestamps from a single numpy scalar.
 
+    The scalar is in nanoseconds, which is how pandas stores datetimes, so the array can be used
+    as a column as-is.
+    """
+    return np.full(length, np.datetime64(value, "ns"))
 
-def test_single_sheet_to_pandas():
-    excel_reader = fastexcel.read_excel(path_for_fixture("fixture-single-sheet.xlsx"))
-    assert excel_reader.sheet_names == ["January"]
-    sheet_by_name = excel_reader.load_sheet("January")
-    sheet_by_idx = excel_reader.load_sheet(0)
+
+def assert_frame_values_equal(actual: DataFrame, expected: DataFrame) -> None:
+    """Column-wise exact comparison of two frames.
+
+    All expected frames in this module have exact dtypes, so the dtype-promoting machinery of
+    `pandas.testing.assert_frame_equal` is not needed: comparing labels, dtypes and the
+    underlying numpy arrays is enough.
+    """
+    assert actual.columns.tolist() == expected.columns.tolist()
+    assert actual.dtypes.tolist() == expected.dtypes.tolist()
+    assert actual.index.equals(expected.index)
+    for column in expected.columns:
+        assert_array_equal(
+            actual[column].to_numpy(), expected[column].to_numpy(), err_msg=column
+        )
+
+
+# Expected frames are built once at import time rather than in every test
+FIXTURE_DATETIME = "2022-03-02T05:43:04"
+
+EXPECTED_MONTH_YEAR = DataFrame({"Month": [1.0, 2.0], "Year": [2019.0, 2020.0]})
+EXPECTED_SHEET2_NO_HEADER = DataFrame(
+    {
+        "__UNNAMED__0": [1.0, 2.0],
+        "__UNNAMED__1": [3.0, 4.0],
+        "__UNNAMED__2": [5.0, 6.0],
+    }
+)
+EXPECTED_SHEET2_CUSTOM_HEADERS = DataFrame(
+    {"foo": [1.0, 2.0], "bar": [3.0, 4.0], "baz": [5.0, 6.0]}
+)
+EXPECTED_SHEET2_SKIPPED_HEADERS = DataFrame(
+    {"Bugs": [1.0, 2.0], "__UNNAMED__1": [3.0, 4.0], "__UNNAMED__2": [5.0, 6.0]}
+)
+
+EXPECTED_MULTI_SHEET_JANUARY = DataFrame({"Month": [1.0], "Year": [2019.0]})
+EXPECTED_MULTI_SHEET_FEBRUARY = DataFrame(
+    {"Month": [2.0, 3.0, 4.0], "Year": [2019.0, 2021.0, 2022.0]}
+)
+EXPECTED_MULTI_SHEET_UNNAMED_COLUMNS = DataFrame(
+    {
+        "col1": [2.0, 3.0],
+        "__UNNAMED__1": [1.5, 2.5],
+        "col3": ["hello", "world"],
+        "__UNNAMED__3": [-5.0, -6.0],
+        "col5": ["a", "b"],
+    }
+)
+
+EXPECTED_TYPES = DataFrame(
+    {
+        "__UNNAMED__0": [0.0, 1.0, 2.0],
+        "bools": [True, False, True],
+        "dates": timestamp_array(FIXTURE_DATETIME, 3),
+        "floats": [12.35, 42.69, 1234567],
+    }
+)
+EXPECTED_TYPES_PAGINATED = DataFrame(
+    {
+        "__UNNAMED__0": [1.0],
+        "bools": [False],
+        "dates": timestamp_array(FIXTURE_DATETIME, 1),
+        "floats": [42.69],
+    }
+)
+EXPECTED_TYPES_SKIPPED_ROWS = DataFrame(
+    {
+        "__UNNAMED__0": [1.0, 2.0],
+        "bools": [False, True],
+        "dates": timestamp_array(FIXTURE_DATETIME, 2),
+        "floats": [42.69, 1234567],
+    }
+)
+EXPECTED_TYPES_FIRST_ROW = DataFrame(
+    {
+        "__UNNAMED__0": [0.0],
+        "bools": [True],
+        "dates": timestamp_array(FIXTURE_DATETIME, 1),
+        "floats": [12.35],
+    }
+)
+EXPECTED_TYPES_NO_HEADERS_FIRST_ROW = DataFrame(
+    {
+        "This": [0.0],
+        "Is": [True],
+        "Amazing": timestamp_array(FIXTURE_DATETIME, 1),
+        "Stuff": [12.35],
+    }
+)
+EXPECTED_TYPES_NO_HEADERS = DataFrame(
+    {
+        "This": [0.0, 1.0, 2.0],
+        "Is": [True, False, True],
+        "Amazing": timestamp_array(FIXTURE_DATETIME, 3),
+        "Stuff": [12.35, 42.69, 1234567],
+    }
+)
+
+
+def test_single_sheet_to_pandas(single_sheet_reader: fastexcel.ExcelReader):
+    assert single_sheet_reader.sheet_names == ["January"]
+    sheet_by_name = single_sheet_reader.load_sheet("January")
+    sheet_by_idx = single_sheet_reader.load_sheet(0)
 
     # Metadata
     assert sheet_by_name.name == sheet_by_idx.name == "January"
     assert sheet_by_name.height == sheet_by_idx.height == 2
     assert sheet_by_name.width == sheet_by_idx.width == 2
 
-    expected = DataFrame({"Month": [1.0, 2.0], "Year": [2019.0, 2020.0]})
-
-    assert_frame_equal(sheet_by_name.to_pandas(), expected)
-    assert_frame_equal(sheet_by_idx.to_pandas(), expected)
+    assert_frame_values_equal(sheet_by_name.to_pandas(), EXPECTED_MONTH_YEAR)
+    assert_frame_values_equal(sheet_by_idx.to_pandas(), EXPECTED_MONTH_YEAR)
 
 
-def test_single_sheet_with_types_to_pandas():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-single-sheet-with-types.xlsx")
-    )
-    assert excel_reader.sheet_names == ["Sheet1"]
+def test_single_sheet_with_types_to_pandas(
+    single_sheet_with_types_reader: fastexcel.ExcelReader,
+):
+    assert single_sheet_with_types_reader.sheet_names == ["Sheet1"]
 
-    sheet = excel_reader.load_sheet(0)
+    sheet = single_sheet_with_types_reader.load_sheet(0)
     assert sheet.name == "Sheet1"
     assert sheet.height == sheet.total_height == 3
     assert sheet.width == 4
 
-    assert_frame_equal(
+    assert_frame_values_equal(
         sheet.to_pandas(),
-        DataFrame(
-            {
-                "__UNNAMED__0": [0.0, 1.0, 2.0],
-                "bools": [True, False, True],
-                "dates": [Timestamp("2022-03-02 05:43:04")] * 3,
-                "floats": [12.35, 42.69, 1234567],
-            }
-        ),
-    )
-
-
-def test_multiple_sheets_to_pandas():
-    excel_reader = fastexcel.read_excel(path_for_fixture("fixture-multi-sheet.xlsx"))
-    assert excel_reader.sheet_names == ["January", "February", "With unnamed columns"]
-
-    assert_frame_equal(
-        excel_reader.load_sheet_by_idx(0).to_pandas(),
-        DataFrame({"Month": [1.0], "Year": [2019.0]}),
+        EXPECTED_TYPES,
     )
 
-    assert_frame_equal(
-        excel_reader.load_sheet_by_idx(1).to_pandas(),
-        DataFrame({"Month": [2.0, 3.0, 4.0], "Year": [2019.0, 2021.0, 2022.0]}),
-    )
-
-    assert_frame_equal(
-        excel_reader.load_sheet_by_name("With unnamed columns").to_pandas(),
-        DataFrame(
-            {
-                "col1": [2.0, 3.0],
-                "__UNNAMED__1": [1.5, 2.5],
-                "col3": ["hello", "world"],
-                "__UNNAMED__3": [-5.0, -6.0],
-                "col5": ["a", "b"],
-            }
-        ),
-    )
-
-
-def test_sheets_with_header_line_diff_from_zero():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-changing-header-location.xlsx")
-    )
-    assert excel_reader.sheet_names == ["Sheet1", "Sheet2", "Sheet3"]
-    sheet_by_name = excel_reader.load_sheet("Sheet1", header_row=1)
-    sheet_by_idx = excel_reader.load_sheet(0, header_row=1)
-
-    # Metadata
-    assert sheet_by_name.name == sheet_by_idx.name == "Sheet1"
-    assert sheet_by_name.height == sheet_by_idx.height == 2
-    assert sheet_by_name.width == sheet_by_idx.width == 2
-
-    expected = DataFrame({"Month": [1.0, 2.0], "Year": [2019.0, 2020.0]})
 
-    assert_frame_equal(sheet_by_name.to_pandas(), expected)
-    assert_frame_equal(sheet_by_idx.to_pandas(), expected)
+def test_concurrent_conversions_on_same_sheet(
+    single_sheet_reader: fastexcel.ExcelReader,
+):
+    n_threads = 4
+    sheet = single_sheet_reader.load_sheet(0)
+
+    # All threads start converting the shared sheet at the same time
+    barrier = Barrier(n_threads)
+
+    def convert(_: int) -> DataFrame:
+        barrier.wait()
+        return sheet.to_pandas()
+
+    with ThreadPoolExecutor(n_threads) as executor:
+        frames = list(executor.map(convert, range(n_threads)))
+
+    for frame in frames:
+        assert_frame_values_equal(frame, EXPECTED_MONTH_YEAR)
+
+
+def test_sheet_metadata_while_converting(
+    single_sheet_with_types_reader: fastexcel.ExcelReader,
+):
+    sheet = single_sheet_with_types_reader.load_sheet(0)
+
+    # Both threads start together, and metadata is read until all conversions are done, so that
+    # reads keep landing while the other thread is inside the Rust conversion, without the GIL
+    barrier = Barrier(2)
+    converted = Event()
+
+    def convert() -> None:
+        barrier.wait()
+        try:
+            for _ in range(50):
+                sheet.to_arrow()
+        finally:
+            converted.set()
+
+    def read_metadata() -> int:
+        barrier.wait()
+        n_reads = 0
+        while not converted.is_set():
+            assert (sheet.width, sheet.height, sheet.total_height) == (4, 3, 3)
+            n_reads += 1
+        return n_reads
+
+    with ThreadPoolExecutor(2) as executor:
+        conversion = executor.submit(convert)
+        reads = executor.submit(read_metadata)
+    conversion.result()
+    assert reads.result() > 0
+
+
+def test_to_pandas_is_column_major(
+    single_sheet_with_types_reader: fastexcel.ExcelReader,
+):
+    """Column-wise operations on a row-major frame are an order of magnitude slower than on a
+    column-major one, so `to_pandas` must not silently start producing row-major data.
+    """
+    df = single_sheet_with_types_reader.load_sheet(0).to_pandas()
+
+    # pandas stores 2D blocks as (n_columns, n_rows): a column-major block is C-contiguous
+    for block in df._mgr.blocks:
+        if isinstance(block.values, np.ndarray):
+            assert block.values.flags[
+                "C_CONTIGUOUS"
+            ], f"{block.dtype} block is row-major"
+
+    for idx, column in enumerate(df.columns):
+        values = df[column].to_numpy()
+        # Every column must be a contiguous view on its block, not a strided slice of a
+        # row-major array
+        assert values.flags["C_CONTIGUOUS"], column
+        block = df._mgr.blocks[df._mgr.blknos[idx]]
+        if isinstance(block.values, np.ndarray):
+            assert np.shares_memory(values, block.values), column
+
+
+def test_multiple_sheets_to_pandas(multi_sheet_reader: fastexcel.ExcelReader):
+    assert multi_sheet_reader.sheet_names == [
+        "January",
+        "February",
+        "With unnamed columns",
+    ]
+
+    sheets = multi_sheet_reader.load_sheets([0, 1, "With unnamed columns"])
+    assert [sheet.name for sheet in sheets] == [
+        "January",
+        "February",
+        "With unnamed columns",
+    ]
+
+    # Sheets are independent from each other once loaded, so they can be converted concurrently
+    with ThreadPoolExecutor(len(sheets)) as executor:
+        january, february, unnamed_columns = executor.map(
+            fastexcel.ExcelSheet.to_pandas, sheets
+        )
 
+    assert_frame_values_equal(january, EXPECTED_MULTI_SHEET_JANUARY)
+    assert_frame_values_equal(february, EXPECTED_MULTI_SHEET_FEBRUARY)
+    assert_frame_values_equal(unnamed_columns, EXPECTED_MULTI_SHEET_UNNAMED_COLUMNS)
 
-def test_sheets_with_no_header():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-changing-header-location.xlsx")
-    )
-    assert excel_reader.sheet_names == ["Sheet1", "Sheet2", "Sheet3"]
-    sheet_by_name = excel_reader.load_sheet("Sheet2", header_row=None)
-    sheet_by_idx = excel_reader.load_sheet(1, header_row=None)
 
-    # Metadata
-    assert sheet_by_name.name == sheet_by_idx.name == "Sheet2"
-    assert sheet_by_name.height == sheet_by_idx.height == 2
-    assert sheet_by_name.width == sheet_by_idx.width == 3
-
-    expected = DataFrame(
-        {
-            "__UNNAMED__0": [1.0, 2.0],
-            "__UNNAMED__1": [3.0, 4.0],
-            "__UNNAMED__2": [5.0, 6.0],
-        }
+def test_load_sheets_with_shared_parameters(multi_sheet_reader: fastexcel.ExcelReader):
+    january, february = multi_sheet_reader.load_sheets(
+        [0, "February"], column_names=["M", "Y"], skip_rows=1, n_rows=1
     )
 
-    assert_frame_equal(sheet_by_name.to_pandas(), expected)
-    assert_frame_equal(sheet_by_idx.to_pandas(), expected)
-
-
-def test_sheets_with_empty_rows_before_header():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-changing-header-location.xlsx")
+    assert (january.name, february.name) == ("January", "February")
+    assert january.height == february.height == 1
+    assert_frame_values_equal(
+        january.to_pandas(), DataFrame({"M": [1.0], "Y": [2019.0]})
     )
-    assert excel_reader.sheet_names == ["Sheet1", "Sheet2", "Sheet3"]
-    sheet_by_name = excel_reader.load_sheet("Sheet3")
-    sheet_by_idx = excel_reader.load_sheet(2)
-
-    # Metadata
-    assert sheet_by_name.name == sheet_by_idx.name == "Sheet3"
-    assert sheet_by_name.height == sheet_by_idx.height == 2
-    assert sheet_by_name.width == sheet_by_idx.width == 2
-
-    expected = DataFrame({"Month": [1.0, 2.0], "Year": [2019.0, 2020.0]})
-
-    assert_frame_equal(sheet_by_name.to_pandas(), expected)
-    assert_frame_equal(sheet_by_idx.to_pandas(), expected)
-
-
-def test_sheets_with_custom_headers():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-changing-header-location.xlsx")
-    )
-    assert excel_reader.sheet_names == ["Sheet1", "Sheet2", "Sheet3"]
-    sheet_by_name = excel_reader.load_sheet(
-        "Sheet2", header_row=None, column_names=["foo", "bar", "baz"]
-    )
-    sheet_by_idx = excel_reader.load_sheet(
-        1, header_row=None, column_names=["foo", "bar", "baz"]
+    assert_frame_values_equal(
+        february.to_pandas(), DataFrame({"M": [2.0], "Y": [2019.0]})
     )
 
-    # Metadata
-    assert sheet_by_name.name == sheet_by_idx.name == "Sheet2"
-    assert sheet_by_name.height == sheet_by_idx.height == 2
-    assert sheet_by_name.width == sheet_by_idx.width == 3
 
-    expected = DataFrame({"foo": [1.0, 2.0], "bar": [3.0, 4.0], "baz": [5.0, 6.0]})
-
-    assert_frame_equal(sheet_by_name.to_pandas(), expected)
-    assert_frame_equal(sheet_by_idx.to_pandas(), expected)
-
-
-def test_sheets_with_skipping_headers():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-changing-header-location.xlsx")
+def test_load_sheets_with_negative_idx(multi_sheet_reader: fastexcel.ExcelReader):
+    with pytest.raises(ValueError, match="Expected idx to be > 0, got -1"):
+        multi_sheet_reader.load_sheets([0, -1, "February"])
+
+
+@pytest.mark.parametrize(
+    "idx_or_names, error",
+    [
+        ([0, "Unknown", 1], "Sheet Unknown not found"),
+        ([0, 42, 1], "Sheet index 42 is out of range. File has 3 sheets"),
+    ],
+)
+def test_load_sheets_with_invalid_sheet(
+    multi_sheet_reader: fastexcel.ExcelReader,
+    idx_or_names: list[int | str],
+    error: str,
+):
+    # A single invalid sheet makes the whole call fail
+    with pytest.raises(RuntimeError, match=error):
+        multi_sheet_reader.load_sheets(idx_or_names)
+
+
+@pytest.mark.parametrize(
+    "sheet_name, sheet_idx, header_row, column_names, width, expected",
+    [
+        # Header line different from zero
+        ("Sheet1", 0, 1, None, 2, EXPECTED_MONTH_YEAR),
+        # No header
+        ("Sheet2", 1, None, None, 3, EXPECTED_SHEET2_NO_HEADER),
+        # Empty rows before header
+        ("Sheet3", 2, 0, None, 2, EXPECTED_MONTH_YEAR),
+        # Custom headers
+        ("Sheet2", 1, None, ["foo", "bar", "baz"], 3, EXPECTED_SHEET2_CUSTOM_HEADERS),
+        # Skipping headers
+        ("Sheet2", 1, 1, ["Bugs"], 3, EXPECTED_SHEET2_SKIPPED_HEADERS),
+    ],
+)
+def test_sheets_with_changing_header_location(
+    changing_header_reader: fastexcel.ExcelReader,
+    sheet_name: str,
+    sheet_idx: int,
+    header_row: int | None,
+    column_names: list[str] | None,
+    width: int,
+    expected: DataFrame,
+):
+    assert changing_header_reader.sheet_names == ["Sheet1", "Sheet2", "Sheet3"]
+    sheet_by_name = changing_header_reader.load_sheet(
+        sheet_name, header_row=header_row, column_names=column_names
     )
-    assert excel_reader.sheet_names == ["Sheet1", "Sheet2", "Sheet3"]
-    sheet_by_name = excel_reader.load_sheet(
-        "Sheet2", header_row=1, column_names=["Bugs"]
+    sheet_by_idx = changing_header_reader.load_sheet(
+        sheet_idx, header_row=header_row, column_names=column_names
     )
-    sheet_by_idx = excel_reader.load_sheet(1, header_row=1, column_names=["Bugs"])
 
     # Metadata
-    assert sheet_by_name.name == sheet_by_idx.name == "Sheet2"
+    assert sheet_by_name.name == sheet_by_idx.name == sheet_name
     assert sheet_by_name.height == sheet_by_idx.height == 2
-    assert sheet_by_name.width == sheet_by_idx.width == 3
-
-    expected = DataFrame(
-        {"Bugs": [1.0, 2.0], "__UNNAMED__1": [3.0, 4.0], "__UNNAMED__2": [5.0, 6.0]}
-    )
-
-    assert_frame_equal(sheet_by_name.to_pandas(), expected)
-    assert_frame_equal(sheet_by_idx.to_pandas(), expected)
-
-
-def test_sheet_with_pagination():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-single-sheet-with-types.xlsx")
-    )
-    assert excel_reader.sheet_names == ["Sheet1"]
-
-    sheet = excel_reader.load_sheet(0, skip_rows=1, n_rows=1)
-    assert sheet.name == "Sheet1"
-    assert sheet.height == 1
-    assert sheet.total_height == 3
-    assert sheet.width == 4
-
-    assert_frame_equal(
-        sheet.to_pandas(),
-        DataFrame(
-            {
-                "__UNNAMED__0": [1.0],
-                "bools": [False],
-                "dates": [Timestamp("2022-03-02 05:43:04")],
-                "floats": [42.69],
-            }
+    assert sheet_by_name.width == sheet_by_idx.width == width
+
+    assert_frame_values_equal(sheet_by_name.to_pandas(), expected)
+    assert_frame_values_equal(sheet_by_idx.to_pandas(), expected)
+
+
+@pytest.mark.parametrize(
+    "header_row, column_names, skip_rows, n_rows, height, total_height, expected",
+    [
+        # Pagination
+        (0, None, 1, 1, 1, 3, EXPECTED_TYPES_PAGINATED),
+        # Skip rows
+        (0, None, 1, None, 2, 3, EXPECTED_TYPES_SKIPPED_ROWS),
+        # N rows
+        (0, None, 0, 1, 1, 3, EXPECTED_TYPES_FIRST_ROW),
+        # Pagination without headers
+        (
+            None,
+            ["This", "Is", "Amazing", "Stuff"],
+            1,
+            1,
+            1,
+            4,
+            EXPECTED_TYPES_NO_HEADERS_FIRST_ROW,
         ),
-    )
-
-
-def test_sheet_with_skip_rows():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-single-sheet-with-types.xlsx")
-    )
-    assert excel_reader.sheet_names == ["Sheet1"]
-
-    sheet = excel_reader.load_sheet(0, skip_rows=1)
-    assert sheet.name == "Sheet1"
-    assert sheet.height == 2
-    assert sheet.width == 4
-
-    assert_frame_equal(
-        sheet.to_pandas(),
-        DataFrame(
-            {
-                "__UNNAMED__0": [1.0, 2.0],
-                "bools": [False, True],
-                "dates": [Timestamp("2022-03-02 05:43:04")] * 2,
-                "floats": [42.69, 1234567],
-            }
+        # More rows requested than available
+        (
+            None,
+            ["This", "Is", "Amazing", "Stuff"],
+            1,
+            1000000,
+            3,
+            4,
+            EXPECTED_TYPES_NO_HEADERS,
         ),
-    )
-
-
-def test_sheet_with_n_rows():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-single-sheet-with-types.xlsx")
-    )
-    assert excel_reader.sheet_names == ["Sheet1"]
-
-    sheet = excel_reader.load_sheet(0, n_rows=1)
-    assert sheet.name == "Sheet1"
-    assert sheet.height == 1
-    assert sheet.width == 4
-
-    assert_frame_equal(
-        sheet.to_pandas(),
-        DataFrame(
-            {
-                "__UNNAMED__0": [0.0],
-                "bools": [True],
-                "dates": [Timestamp("2022-03-02 05:43:04")],
-                "floats": [12.35],
-            }
-        ),
-    )
-
-
-def test_sheet_with_pagination_and_without_headers():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-single-sheet-with-types.xlsx")
-    )
-    assert excel_reader.sheet_names == ["Sheet1"]
-
-    sheet = excel_reader.load_sheet(
+    ],
+)
+def test_sheet_with_pagination(
+    single_sheet_with_types_reader: fastexcel.ExcelReader,
+    header_row: int | None,
+    column_names: list[str] | None,
+    skip_rows: int,
+    n_rows: int | None,
+    height: int,
+    total_height: int,
+    expected: DataFrame,
+):
+    assert single_sheet_with_types_reader.sheet_names == ["Sheet1"]
+
+    sheet = single_sheet_with_types_reader.load_sheet(
         0,
-        n_rows=1,
-        skip_rows=1,
-        header_row=None,
-        column_names=["This", "Is", "Amazing", "Stuff"],
+        header_row=header_row,
+        column_names=column_names,
+        skip_rows=skip_rows,
+        n_rows=n_rows,
     )
     assert sheet.name == "Sheet1"
-    assert sheet.height == 1
+    assert sheet.height == height
+    assert sheet.total_height == total_height
     assert sheet.width == 4
 
-    assert_frame_equal(
-        sheet.to_pandas(),
-        DataFrame(
-            {
-                "This": [0.0],
-                "Is": [True],
-                "Amazing": [Timestamp("2022-03-02 05:43:04")],
-                "Stuff": [12.35],
-            }
-        ),
-    )
+    assert_frame_values_equal(sheet.to_pandas(), expected)
 
 
-def test_sheet_with_pagination_out_of_bound():
-    excel_reader = fastexcel.read_excel(
-        path_for_fixture("fixture-single-sheet-with-types.xlsx")
-    )
-    assert excel_reader.sheet_names == ["Sheet1"]
-
+def test_sheet_with_pagination_out_of_bound(
+    single_sheet_with_types_reader: fastexcel.ExcelReader,
+):
     with pytest.raises(RuntimeError, match="To many rows skipped. Max height is 4"):
-        excel_reader.load_sheet(
+        single_sheet_with_types_reader.load_sheet(
             0,
             skip_rows=1000000,
             header_row=None,
             column_names=["This", "Is", "Amazing", "Stuff"],
         )
-
-    sheet = excel_reader.load_sheet(
-        0,
-        n_rows=1000000,
-        skip_rows=1,
-        header_row=None,
-        column_names=["This", "Is", "Amazing", "Stuff"],
-    )
-    assert sheet.name == "Sheet1"
-    assert sheet.height == 3
-    assert sheet.width == 4
-
-    assert_frame_equal(
-        sheet.to_pandas(),
-        DataFrame(
-            {
-                "This": [0.0, 1.0, 2.0],
-                "Is": [True, False, True],
-                "Amazing": [Timestamp("2022-03-02 05:43:04")] * 3,
-                "Stuff": [12.35, 42.69, 1234567],
-            }
-        ),
-    )
@@ -0,0 +1,50 @@
+import os
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+
+import fastexcel
+
+# Generating the workbook and timing the read is too slow and too noisy for every run, so these
+# tests only run when explicitly requested
+pytestmark = pytest.mark.skipif(
+    os.environ.get("FASTEXCEL_PERF") != "1",
+    reason="perf tests only run with FASTEXCEL_PERF=1",
+)
+
+BIG_SHEET_HEIGHT = 100_000
+# Upper bound for reading and converting the big sheet, in seconds. Meant for release builds
+BIG_SHEET_BUDGET = 2.0
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_up(single_sheet_reader: fastexcel.ExcelReader) -> None:
+    # Read and convert a small sheet before timing anything, so that one-time initialization
+    # costs of the extension module are not counted in the budgets
+    single_sheet_reader.load_sheet(0).to_pandas()
+
+
+@pytest.fixture(scope="session")
+def big_sheet_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    xlsxwriter = pytest.importorskip("xlsxwriter")
+
+    path: Path = tmp_path_factory.mktemp("perf") / "big-sheet.xlsx"
+    workbook = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+    worksheet = workbook.add_worksheet()
+    worksheet.write_row(0, 0, ["ints", "floats", "strings"])
+    for row in range(1, BIG_SHEET_HEIGHT + 1):
+        worksheet.write_row(row, 0, [row, row * 1.5, f"s{row}"])
+    workbook.close()
+    return str(path)
+
+
+def test_big_sheet_to_pandas_within_budget(big_sheet_path: str):
+    start = perf_counter()
+    df = fastexcel.read_excel(big_sheet_path).load_sheet(0).to_pandas()
+    elapsed = perf_counter() - start
+
+    assert df.shape == (BIG_SHEET_HEIGHT, 3)
+    assert (
+        elapsed < BIG_SHEET_BUDGET
+    ), f"took {elapsed:.2f}s, budget is {BIG_SHEET_BUDGET}s"
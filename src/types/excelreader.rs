@@ -2,13 +2,19 @@ use std::{fs::File, io::BufReader};
 
 use anyhow::{Context, Result};
 use calamine::{open_workbook_auto, Reader, Sheets};
-use pyo3::{pyclass, pymethods};
+use pyo3::{pyclass, pymethods, FromPyObject};
 
 use super::{
     excelsheet::{Header, Pagination},
     ExcelSheet,
 };
 
+#[derive(FromPyObject)]
+pub(crate) enum IdxOrName {
+    Idx(usize),
+    Name(String),
+}
+
 #[pyclass(name = "_ExcelReader")]
 pub(crate) struct ExcelReader {
     sheets: Sheets<BufReader<File>>,
@@ -101,4 +107,37 @@ impl ExcelReader {
         let pagination = Pagination::new(skip_rows, n_rows, &range)?;
         Ok(ExcelSheet::new(name, range, header, pagination))
     }
+
+    #[args(
+        idx_or_names,
+        "*",
+        header_row = 0,
+        column_names = "None",
+        skip_rows = 0,
+        n_rows = "None"
+    )]
+    pub fn load_sheets(
+        &mut self,
+        idx_or_names: Vec<IdxOrName>,
+        header_row: Option<usize>,
+        column_names: Option<Vec<String>>,
+        skip_rows: usize,
+        n_rows: Option<usize>,
+    ) -> Result<Vec<ExcelSheet>> {
+        idx_or_names
+            .into_iter()
+            .map(|idx_or_name| match idx_or_name {
+                IdxOrName::Idx(idx) => {
+                    self.load_sheet_by_idx(idx, header_row, column_names.clone(), skip_rows, n_rows)
+                }
+                IdxOrName::Name(name) => self.load_sheet_by_name(
+                    name,
+                    header_row,
+                    column_names.clone(),
+                    skip_rows,
+                    n_rows,
+                ),
+            })
+            .collect()
+    }
 }
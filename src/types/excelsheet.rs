@@ -11,9 +11,9 @@ use arrow::{
 };
 use calamine::{DataType as CalDataType, Range};
 
-use pyo3::{pyclass, pymethods, PyObject, Python};
+use pyo3::{pyclass, pymethods, types::PyBytes, PyObject, Python};
 
-use crate::utils::arrow::{arrow_schema_from_column_names_and_range, record_batch_to_pybytes};
+use crate::utils::arrow::{arrow_schema_from_column_names_and_range, record_batch_to_bytes};
 
 pub(crate) enum Header {
     None,
@@ -71,9 +71,6 @@ pub(crate) struct ExcelSheet {
     header: Header,
     pagination: Pagination,
     data: Range<CalDataType>,
-    height: Option<usize>,
-    total_height: Option<usize>,
-    width: Option<usize>,
 }
 
 impl ExcelSheet {
@@ -92,9 +89,6 @@ impl ExcelSheet {
             header,
             pagination,
             data,
-            height: None,
-            total_height: None,
-            width: None,
         }
     }
 
@@ -248,30 +242,18 @@ impl TryFrom<&ExcelSheet> for RecordBatch {
 #[pymethods]
 impl ExcelSheet {
     #[getter]
-    pub fn width(&mut self) -> usize {
-        self.width.unwrap_or_else(|| {
-            let width = self.data.width();
-            self.width = Some(width);
-            width
-        })
+    pub fn width(&self) -> usize {
+        self.data.width()
     }
 
     #[getter]
-    pub fn height(&mut self) -> usize {
-        self.height.unwrap_or_else(|| {
-            let height = self.limit() - self.offset();
-            self.height = Some(height);
-            height
-        })
+    pub fn height(&self) -> usize {
+        self.limit() - self.offset()
     }
 
     #[getter]
-    pub fn total_height(&mut self) -> usize {
-        self.total_height.unwrap_or_else(|| {
-            let total_height = self.data.height() - self.header.offset();
-            self.total_height = Some(total_height);
-            total_height
-        })
+    pub fn total_height(&self) -> usize {
+        self.data.height() - self.header.offset()
     }
 
     #[getter]
@@ -280,9 +262,15 @@ impl ExcelSheet {
     }
 
     pub fn to_arrow(&self, py: Python<'_>) -> Result<PyObject> {
-        let rb = RecordBatch::try_from(self)
-            .with_context(|| format!("Could not create RecordBatch from sheet {}", self.name))?;
-        record_batch_to_pybytes(py, &rb).map(|pybytes| pybytes.into())
+        // Building and serializing the RecordBatch does not involve any Python object, so other
+        // threads can run while we're at it
+        let bytes = py.allow_threads(|| {
+            let rb = RecordBatch::try_from(self).with_context(|| {
+                format!("Could not create RecordBatch from sheet {}", self.name)
+            })?;
+            record_batch_to_bytes(&rb)
+        })?;
+        Ok(PyBytes::new(py, bytes.as_slice()).into())
     }
 
     pub fn __repr__(&self) -> String {
@@ -5,7 +5,6 @@ use arrow::{
     record_batch::RecordBatch,
 };
 use calamine::{DataType as CalDataType, Range};
-use pyo3::{types::PyBytes, Python};
 
 pub(crate) fn record_batch_to_bytes(rb: &RecordBatch) -> Result<Vec<u8>> {
     let mut writer = StreamWriter::try_new(Vec::new(), &rb.schema())
@@ -67,7 +66,3 @@ pub(crate) fn arrow_schema_from_column_names_and_range(
 
     Ok(Schema::new(fields))
 }
-
-pub(crate) fn record_batch_to_pybytes<'p>(py: Python<'p>, rb: &RecordBatch) -> Result<&'p PyBytes> {
-    record_batch_to_bytes(rb).map(|bytes| PyBytes::new(py, bytes.as_slice()))
-}
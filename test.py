@@ -6,14 +6,23 @@ import fastexcel
 def get_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("file")
+    parser.add_argument(
+        "-i",
+        "--iterations",
+        type=int,
+        default=1,
+        help="How many times every sheet should be loaded and converted",
+    )
     return parser.parse_args()
 
 
 def main():
     args = get_args()
+    # The file is opened once, so that iterations only measure sheet loading and conversion
     excel_file = fastexcel.read_excel(args.file)
-    for sheet_name in excel_file.sheet_names:
-        excel_file.load_sheet_by_name(sheet_name).to_pandas()
+    for _ in range(args.iterations):
+        for sheet_name in excel_file.sheet_names:
+            excel_file.load_sheet_by_name(sheet_name).to_pandas()
 
 
 if __name__ == "__main__":